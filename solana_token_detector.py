@@ -11,16 +11,30 @@ An enhanced version of the Solana token monitoring bot with:
 - Configurable risk thresholds
 """
 
-import json
+import asyncio
+import itertools
 import os
+import random
 import signal
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Set, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Set, Optional, Tuple
+import aiohttp
+import orjson
 import requests
+import zstandard as zstd
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import keyboard
-import msvcrt
+
+try:
+    import msvcrt
+except ImportError:  # POSIX terminals
+    msvcrt = None
+    import termios
+    import tty
 
 # Simple Text Header - Guaranteed to work in all terminals
 ASCII_ART = """
@@ -34,6 +48,9 @@ ASCII_ART = """
 \033[93m🚀 Real-time token detection with rug-pull risk analysis\033[0m
 """
 
+# Header pre-encoded once, since it is redrawn on every menu refresh
+HEADER_BYTES = ASCII_ART.encode("utf-8") + b"\n\n"
+
 # Configuration file
 CONFIG_FILE = "config.json"
 DEFAULT_CONFIG = {
@@ -42,16 +59,91 @@ DEFAULT_CONFIG = {
     "api_timeout": 30
 }
 
+# Parsed config.json, keyed by the file's mtime and size
+_config_cache: Dict = {"data": None, "version": None}
+
 # API endpoints
 BASE_URL = "https://api.rugcheck.xyz/v1"
 NEW_TOKENS_ENDPOINT = f"{BASE_URL}/stats/new_tokens"
 SUMMARY_ENDPOINT_TEMPLATE = f"{BASE_URL}/tokens/{{mint}}/report/summary"
 
+# Concurrency limits for summary fetches
+MAX_CONNECTIONS = 20
+MAX_CONCURRENT_SUMMARIES = 8
+
+# Retry policy for rate-limited (HTTP 429) summary requests
+SUMMARY_MAX_RETRIES = 3
+SUMMARY_BACKOFF_BASE = 1.0  # seconds
+SUMMARY_MAX_RETRY_DELAY = 10  # seconds; longer waits give up until the next poll
+
+# Shared HTTP session so the new-tokens poll reuses its keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Retry-After is ignored: an unbounded server-requested wait would stall the poll
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=False),
+))
+SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
+# Blocking new-tokens fetches run here rather than in asyncio's default executor,
+# which asyncio.run joins on exit and would make Ctrl+C wait out the request
+FEED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="new-tokens")
+
+# Validators from the last new-tokens response, sent back as a conditional GET
+_last_etag: Optional[str] = None
+_last_modified: Optional[str] = None
+_last_tokens: List[Dict] = []
+
+# Recommendation shown for each risk level
+RECOMMENDATIONS = {
+    "LOW": "SAFE_TO_BUY",
+    "MEDIUM": "CAUTION_ADVISED",
+    "HIGH": "HIGH_RISK_DONT_BUY",
+    "UNKNOWN": "CAUTION_ADVISED",
+}
+
+# Console report for a detected token, filled in by format_report
+REPORT_TEMPLATE = (
+    "=" * 80 + "\n"
+    "🚀 NEW TOKEN DETECTED!\n"
+    + "=" * 80 + "\n"
+    "\n"
+    "📋 TOKEN INFORMATION:\n"
+    "✅ Token Name: {name}\n"
+    "✅ Token Symbol: {symbol}\n"
+    "✅ Token Mint: {mint}\n"
+    "👤 Creator Wallet: {creator}\n"
+    "🕒 Detection Time: {detected_at}\n"
+    "\n"
+    "📊 RUGCHECK ANALYSIS:\n"
+    "- Safety Score: {score}/100\n"
+    "- Risk Level: {risk}\n"
+    "- Recommendation: {recommendation}"
+)
+
 # Timezone for Lagos (UTC+1)
 LAGOS_TZ = timezone(timedelta(hours=1))
 
 # Filenames for persistent storage
-SAFE_TO_BUY_FILE = os.path.join(os.path.dirname(__file__), "safe_to_buy.json")
+SAFE_TO_BUY_FILE = os.path.join(os.path.dirname(__file__), "safe_to_buy.jsonl.zst")
+LEGACY_SAFE_TO_BUY_FILES = [
+    os.path.join(os.path.dirname(__file__), "safe_to_buy.jsonl"),
+    os.path.join(os.path.dirname(__file__), "safe_to_buy.json"),
+]
+PROCESSED_FILE = os.path.join(os.path.dirname(__file__), "processed_mints.txt")
+KNOWN_BAD_CREATORS_FILE = os.path.join(os.path.dirname(__file__), "known_bad_creators.txt")
+
+# Safe-token store compression; each flushed batch is its own zstd frame
+ZSTD_LEVEL = 3
+ZSTD_READ_SIZE = 64 * 1024
+_compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL, write_checksum=True)
+_decompressor = zstd.ZstdDecompressor()
+
+# Safe-token writes are queued during a poll and written once it finishes
+_KNOWN_MINTS: Set[str] = set()
+_PENDING_ENTRIES: List[Dict] = []
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -60,127 +152,389 @@ def clear_screen():
 def print_header():
     """Print the ASCII art header."""
     clear_screen()
-    print(ASCII_ART)
-    print()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(HEADER_BYTES)
+    sys.stdout.buffer.flush()
 
 def load_config() -> Dict:
-    """Load configuration from file."""
-    if not os.path.exists(CONFIG_FILE):
-        save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+    """Load configuration from file, re-parsing only when it has changed on disk."""
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return DEFAULT_CONFIG
+        stat = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        save_config(DEFAULT_CONFIG)
+        return dict(DEFAULT_CONFIG)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if version != _config_cache["version"]:
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, OSError):
+            return dict(DEFAULT_CONFIG)
+        _config_cache["data"] = data
+        _config_cache["version"] = version
+    # Callers edit the returned dict, so hand out a copy of the cached one
+    return dict(_config_cache["data"])
+
+def write_file_atomic(file_path: str, data: bytes) -> None:
+    """Write a file via a synced temp file so a crash never leaves it half-written."""
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
 
 def save_config(config: Dict) -> None:
     """Save configuration to file."""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    write_file_atomic(CONFIG_FILE, orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
 def load_json(file_path: str) -> List[Dict]:
     """Load a list of dictionaries from a JSON file."""
     if not os.path.exists(file_path):
         return []
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, OSError):
         return []
 
-def save_json(file_path: str, data: List[Dict]) -> None:
-    """Save a list of dictionaries to a JSON file."""
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+def iter_zstd_frames(file_path: str) -> Iterator[Tuple[int, bytes]]:
+    """Yield (end offset, content) for each complete zstd frame in a file.
+
+    Stops at the first truncated or corrupt frame.
+    """
+    with open(file_path, "rb") as f:
+        offset = 0
+        leftover = b""
+        while True:
+            chunk = leftover or f.read(ZSTD_READ_SIZE)
+            if not chunk:
+                return
+            dobj = _decompressor.decompressobj()
+            parts = []
+            fed = 0
+            try:
+                while True:
+                    fed += len(chunk)
+                    parts.append(dobj.decompress(chunk))
+                    if dobj.eof:
+                        break
+                    chunk = f.read(ZSTD_READ_SIZE)
+                    if not chunk:
+                        return
+            except zstd.ZstdError:
+                return
+            leftover = dobj.unused_data
+            offset += fed - len(leftover)
+            yield offset, b"".join(parts)
+
+def repair_store(file_path: str) -> None:
+    """Truncate a compressed store back to its last complete frame.
+
+    A crash mid-flush leaves a partial frame at the end, and appending after it
+    would make every later frame unreadable.
+    """
+    if not os.path.exists(file_path):
+        return
+    good_end = 0
+    for good_end, _ in iter_zstd_frames(file_path):
+        pass
+    if good_end < os.path.getsize(file_path):
+        os.truncate(file_path, good_end)
+
+def iter_lines(file_path: str) -> Iterator[bytes]:
+    """Yield the raw lines of a file, decompressing .zst files frame by frame."""
+    if file_path.endswith(".zst"):
+        for _, content in iter_zstd_frames(file_path):
+            yield from content.splitlines()
+    else:
+        with open(file_path, "rb") as f:
+            yield from f
+
+def iter_jsonl(file_path: str) -> Iterator[Dict]:
+    """Yield dictionaries from a newline-delimited JSON file, one line at a time.
+
+    Files ending in .zst are decompressed on the fly.
+    """
+    if not os.path.exists(file_path):
+        return
+    for line in iter_lines(file_path):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(item, dict):
+            yield item
+
+def migrate_legacy_store(legacy_path: str, store_path: str) -> None:
+    """Convert an older JSON or JSONL store to compressed JSONL, once."""
+    if os.path.exists(store_path) or not os.path.exists(legacy_path):
+        return
+    if legacy_path.endswith(".json"):
+        # Parse directly rather than via load_json, which hides a corrupt file as []
+        try:
+            with open(legacy_path, "rb") as f:
+                items = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, OSError) as exc:
+            print(f"⚠️  Not migrating {os.path.basename(legacy_path)}, it could not be read: {exc}")
+            return
+        if not isinstance(items, list):
+            print(f"⚠️  Not migrating {os.path.basename(legacy_path)}, it is not a list of tokens")
+            return
+    else:
+        items = iter_jsonl(legacy_path)
+    data = b"".join(orjson.dumps(item) + b"\n" for item in items if isinstance(item, dict))
+    write_file_atomic(store_path, _compressor.compress(data))
+
+def load_known_mints(file_path: str) -> Set[str]:
+    """Collect the mints already stored in a JSONL file."""
+    return {item["mint"] for item in iter_jsonl(file_path) if item.get("mint")}
 
-def fetch_new_tokens() -> List[Dict]:
-    """Fetch a list of newly minted tokens from RugCheck."""
+def fetch_new_tokens(timeout: int = 30) -> List[Dict]:
+    """Fetch a list of newly minted tokens from RugCheck.
+
+    When the feed hasn't changed since the last poll, the previously parsed
+    list is returned without re-downloading it, so mints whose summary fetch
+    failed are still retried.
+    """
+    global _last_etag, _last_modified, _last_tokens
+    headers = {}
+    if _last_etag:
+        headers["If-None-Match"] = _last_etag
+    if _last_modified:
+        headers["If-Modified-Since"] = _last_modified
     try:
-        response = requests.get(NEW_TOKENS_ENDPOINT, timeout=30)
+        response = SESSION.get(NEW_TOKENS_ENDPOINT, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            return _last_tokens
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as exc:
+        tokens = orjson.loads(response.content)
+        # Only remember validators for a body that parsed, or a bad feed would be skipped as 304s
+        _last_etag = response.headers.get("ETag")
+        _last_modified = response.headers.get("Last-Modified")
+        _last_tokens = tokens
+        return tokens
+    except (requests.RequestException, orjson.JSONDecodeError) as exc:
         print(f"⚠️  Error fetching new tokens: {exc}")
         return []
 
-def fetch_token_summary(mint: str) -> Dict:
-    """Fetch a summary report for a token mint."""
+def retry_delay(retry_after: Optional[str], attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited request, or None to give up."""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = SUMMARY_BACKOFF_BASE * 2 ** attempt
+    # The wait holds a semaphore slot outside the request timeout, so keep it short
+    if delay > SUMMARY_MAX_RETRY_DELAY:
+        return None
+    # Jitter so concurrent retries don't hit the API in lockstep
+    return delay + random.uniform(0, SUMMARY_BACKOFF_BASE)
+
+async def fetch_token_summary_async(session: aiohttp.ClientSession, mint: str,
+                                    semaphore: asyncio.Semaphore) -> Dict:
+    """Fetch a summary report for a token mint without blocking the event loop."""
     url = SUMMARY_ENDPOINT_TEMPLATE.format(mint=mint)
     try:
-        res = requests.get(url, timeout=30)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return {}
-    except requests.RequestException:
+        async with semaphore:
+            for attempt in range(SUMMARY_MAX_RETRIES + 1):
+                async with session.get(url) as res:
+                    if res.status == 200:
+                        return orjson.loads(await res.read())
+                    if res.status != 429 or attempt == SUMMARY_MAX_RETRIES:
+                        return {}
+                    delay = retry_delay(res.headers.get("Retry-After"), attempt)
+                    if delay is None:
+                        return {}
+                await asyncio.sleep(delay)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
         return {}
 
-def classify_risk(score_normalised: int | None, threshold: int) -> str:
-    """Classify risk based on configurable threshold."""
-    if score_normalised is None:
-        return "UNKNOWN"
+async def fetch_token_summaries_batch(session: aiohttp.ClientSession, mints: List[str],
+                                      semaphore: asyncio.Semaphore) -> Dict[str, Dict]:
+    """Fetch summaries for a batch of mints, keyed by mint.
+
+    RugCheck has no public multi-mint summary endpoint, so the batch is issued
+    as concurrent per-mint requests bounded by the semaphore.
+    """
+    unique_mints = list(dict.fromkeys(mints))
+    summaries = await asyncio.gather(
+        *[fetch_token_summary_async(session, mint, semaphore) for mint in unique_mints]
+    )
+    return dict(zip(unique_mints, summaries))
+
+def risk_for_score(score_normalised: float, threshold: int) -> str:
+    """Classify a known score against the threshold."""
     if score_normalised > threshold:
         return "LOW"
     if score_normalised >= 50:
         return "MEDIUM"
     return "HIGH"
 
+@lru_cache(maxsize=None)
+def build_risk_table(threshold: int) -> tuple:
+    """Precompute the risk level for every score from 0 to 100."""
+    return tuple(risk_for_score(score, threshold) for score in range(101))
+
+def classify_risk(score_normalised: int | None, threshold: int) -> str:
+    """Classify risk based on configurable threshold."""
+    if score_normalised is None:
+        return "UNKNOWN"
+    if type(score_normalised) is int and 0 <= score_normalised <= 100:
+        return build_risk_table(threshold)[score_normalised]
+    # Scores outside the table's range (or non-integers) are compared directly
+    return risk_for_score(score_normalised, threshold)
+
 def format_report(token: Dict, summary: Dict, detected_at: str, threshold: int) -> str:
     """Format a console report for a detected token."""
     mint = token.get("mint", "Unknown")
-    symbol = token.get("symbol") or summary.get("tokenMeta", {}).get("symbol", "")
-    name = summary.get("tokenMeta", {}).get("name", symbol or "Unknown Token")
+    meta = summary.get("tokenMeta") or {}
+    symbol = token.get("symbol") or meta.get("symbol", "")
+    name = meta.get("name", symbol or "Unknown Token")
     creator = token.get("creator") or summary.get("creator", "Unknown")
     score_norm = summary.get("score_normalised")
-    score_display = score_norm if score_norm is not None else "N/A"
     risk = classify_risk(score_norm, threshold)
     
-    recommendation = {
-        "LOW": "SAFE_TO_BUY",
-        "MEDIUM": "CAUTION_ADVISED",
-        "HIGH": "HIGH_RISK_DONT_BUY",
-        "UNKNOWN": "CAUTION_ADVISED",
-    }[risk]
-    
-    lines = []
-    lines.append("=" * 80)
-    lines.append("🚀 NEW TOKEN DETECTED!")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append("📋 TOKEN INFORMATION:")
-    lines.append(f"✅ Token Name: {name}")
-    lines.append(f"✅ Token Symbol: {symbol}")
-    lines.append(f"✅ Token Mint: {mint}")
-    lines.append(f"👤 Creator Wallet: {creator}")
-    lines.append(f"🕒 Detection Time: {detected_at}")
-    lines.append("")
-    lines.append("📊 RUGCHECK ANALYSIS:")
-    lines.append(f"- Safety Score: {score_display}/100")
-    lines.append(f"- Risk Level: {risk}")
-    lines.append(f"- Recommendation: {recommendation}")
+    report = REPORT_TEMPLATE.format_map({
+        "name": name,
+        "symbol": symbol,
+        "mint": mint,
+        "creator": creator,
+        "detected_at": detected_at,
+        "score": score_norm if score_norm is not None else "N/A",
+        "risk": risk,
+        "recommendation": RECOMMENDATIONS[risk],
+    })
     
     risks_list = summary.get("risks") or []
     if risks_list:
-        lines.append("- Risk Reasons:")
-        for risk_item in risks_list:
-            name = risk_item.get("name", "Unknown Risk")
-            desc = risk_item.get("description", "")
-            level = risk_item.get("level", "")
-            lines.append(f"    • {name} ({level}) - {desc}")
+        report += "\n- Risk Reasons:" + "".join(
+            f"\n    • {item.get('name', 'Unknown Risk')} ({item.get('level', '')}) - {item.get('description', '')}"
+            for item in risks_list
+        )
     
-    return "\n".join(lines)
+    return report
 
-def append_if_not_exists(file_path: str, entry: Dict) -> None:
-    """Append a token entry to a JSON file if it's not already present."""
-    existing = load_json(file_path)
-    mints = {item.get("mint") for item in existing if isinstance(item, dict)}
-    if entry.get("mint") not in mints:
-        existing.append(entry)
-        save_json(file_path, existing)
+def load_word_set(file_path: str) -> Set[str]:
+    """Load a whitespace-separated list of mints or wallets into a set."""
+    if not os.path.exists(file_path):
+        return set()
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return set(f.read().split())
+    except OSError:
+        return set()
+
+def is_candidate(token: Dict, bad_creators: Set[str]) -> bool:
+    """Cheaply reject a new-tokens feed entry before fetching its summary.
+
+    Feed entries carry ``mint``, ``symbol`` and ``creator``. Tokens without a
+    mint or symbol, or minted by a known bad creator, aren't worth a request.
+    """
+    if not token.get("mint") or not token.get("symbol"):
+        return False
+    return token.get("creator") not in bad_creators
+
+def append_if_not_exists(entry: Dict) -> None:
+    """Queue a token entry for the safe-token store if it's not already present."""
+    mint = entry.get("mint")
+    if mint in _KNOWN_MINTS:
+        return
+    _KNOWN_MINTS.add(mint)
+    _PENDING_ENTRIES.append(entry)
 
-def start_monitoring():
+def flush_pending_entries(store) -> None:
+    """Write all queued entries to the store in one batch."""
+    if not _PENDING_ENTRIES:
+        return
+    data = b"".join(orjson.dumps(entry) + b"\n" for entry in _PENDING_ENTRIES)
+    store.write(_compressor.compress(data))
+    store.flush()
+    # Flushes only happen between polls, so syncing here stays off the hot path
+    os.fsync(store.fileno())
+    _PENDING_ENTRIES.clear()
+
+def install_stop_handler(loop: asyncio.AbstractEventLoop, stop_event: asyncio.Event) -> None:
+    """Make Ctrl+C set the stop event instead of raising KeyboardInterrupt."""
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop_event.set)
+    except NotImplementedError:  # Windows event loops
+        signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(stop_event.set))
+
+def remove_stop_handler(loop: asyncio.AbstractEventLoop) -> None:
+    """Restore the default Ctrl+C behaviour."""
+    try:
+        loop.remove_signal_handler(signal.SIGINT)
+    except NotImplementedError:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+async def poll_new_tokens(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          processed: Set[str], processed_log, bad_creators: Set[str],
+                          config: Dict) -> None:
+    """Fetch the new-tokens feed once and report every mint not seen before."""
+    threshold = config["score_threshold"]
+    loop = asyncio.get_running_loop()
+    tokens = await loop.run_in_executor(FEED_EXECUTOR, fetch_new_tokens, config["api_timeout"])
+    now_str = datetime.now(LAGOS_TZ).strftime("%Y-%m-%d %H:%M:%S %Z")
+    
+    seen: Set[str] = set()
+    rejected_mints: List[str] = []
+    new_tokens: Dict[str, Dict] = {}
+    for token in tokens:
+        mint = token.get("mint")
+        if not mint or mint in processed or mint in seen:
+            continue
+        seen.add(mint)
+        if is_candidate(token, bad_creators):
+            new_tokens[mint] = token
+        else:
+            rejected_mints.append(mint)
+    
+    summaries = await fetch_token_summaries_batch(session, list(new_tokens), semaphore)
+    
+    # Failed fetches stay out of the processed set so the next poll retries them
+    done_mints = rejected_mints + [mint for mint in new_tokens if summaries.get(mint)]
+    processed.update(done_mints)
+    if done_mints:
+        processed_log.write("".join(mint + "\n" for mint in done_mints))
+        processed_log.flush()
+    
+    for mint, token in new_tokens.items():
+        summary = summaries.get(mint)
+        if not summary:
+            continue
+        
+        meta = summary.get("tokenMeta") or {}
+        score_norm = summary.get("score_normalised")
+        risk = classify_risk(score_norm, threshold)
+        
+        # Debug logging
+        print(f"🔍 DEBUG: Token {token.get('symbol', 'Unknown')} - Score: {score_norm}, Threshold: {threshold}, Risk: {risk}")
+        
+        entry = {
+            "mint": mint,
+            "name": meta.get("name", ""),
+            "symbol": token.get("symbol") or meta.get("symbol", ""),
+            "creator": token.get("creator") or summary.get("creator", ""),
+            "score_normalised": score_norm,
+            "risk": risk,
+            "risks": summary.get("risks") or [],
+            "detected_at": now_str,
+        }
+        
+        if risk == "LOW":
+            print(f"✅ SAVING: Token {token.get('symbol', 'Unknown')} with score {score_norm} (>{threshold})")
+            append_if_not_exists(entry)
+        else:
+            print(f"❌ NOT SAVING: Token {token.get('symbol', 'Unknown')} with score {score_norm} (risk: {risk})")
+        
+        report = format_report(token, summary, now_str, threshold)
+        print(report)
+        print("\n")
+
+async def start_monitoring():
     """Start real-time token monitoring."""
     config = load_config()
     threshold = config["score_threshold"]
@@ -190,72 +544,74 @@ def start_monitoring():
     print(f"⏱️  Polling interval: {interval} seconds")
     print("Press Ctrl+C to stop monitoring\n")
     
-    processed: Set[str] = set()
+    processed = load_word_set(PROCESSED_FILE)
+    bad_creators = load_word_set(KNOWN_BAD_CREATORS_FILE)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=config["api_timeout"])
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
     
+    repair_store(SAFE_TO_BUY_FILE)
+    _KNOWN_MINTS.clear()
+    _KNOWN_MINTS.update(load_known_mints(SAFE_TO_BUY_FILE))
+    
+    with open(SAFE_TO_BUY_FILE, "ab") as store, \
+            open(PROCESSED_FILE, "a", encoding="utf-8") as processed_log:
+        install_stop_handler(loop, stop_event)
+        try:
+            # One long-lived session so TCP/TLS connections are reused across polls
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                while not stop_event.is_set():
+                    # Race the poll against Ctrl+C so a slow request can't delay shutdown
+                    poll = asyncio.create_task(
+                        poll_new_tokens(session, semaphore, processed, processed_log, bad_creators, config)
+                    )
+                    stop = asyncio.create_task(stop_event.wait())
+                    await asyncio.wait({poll, stop}, return_when=asyncio.FIRST_COMPLETED)
+                    stop.cancel()
+                    if not poll.done():
+                        poll.cancel()
+                        await asyncio.wait({poll})
+                        break
+                    poll.result()
+                    flush_pending_entries(store)
+                    # Sleep until the next poll, waking early if Ctrl+C is pressed
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            remove_stop_handler(loop)
+            flush_pending_entries(store)
+
+def run_monitoring():
+    """Run the monitoring event loop until the user presses Ctrl+C."""
     try:
-        while True:
-            tokens = fetch_new_tokens()
-            now_str = datetime.now(LAGOS_TZ).strftime("%Y-%m-%d %H:%M:%S %Z")
-            
-            for token in tokens:
-                mint = token.get("mint")
-                if not mint or mint in processed:
-                    continue
-                    
-                summary = fetch_token_summary(mint)
-                if not summary:
-                    processed.add(mint)
-                    continue
-                
-                processed.add(mint)
-                score_norm = summary.get("score_normalised")
-                risk = classify_risk(score_norm, threshold)
-                
-                # Debug logging
-                print(f"🔍 DEBUG: Token {token.get('symbol', 'Unknown')} - Score: {score_norm}, Threshold: {threshold}, Risk: {risk}")
-                
-                entry = {
-                    "mint": mint,
-                    "name": summary.get("tokenMeta", {}).get("name", ""),
-                    "symbol": token.get("symbol") or summary.get("tokenMeta", {}).get("symbol", ""),
-                    "creator": token.get("creator") or summary.get("creator", ""),
-                    "score_normalised": score_norm,
-                    "risk": risk,
-                    "risks": summary.get("risks", []),
-                    "detected_at": now_str,
-                }
-                
-                if risk == "LOW":
-                    print(f"✅ SAVING: Token {token.get('symbol', 'Unknown')} with score {score_norm} (>{threshold})")
-                    append_if_not_exists(SAFE_TO_BUY_FILE, entry)
-                else:
-                    print(f"❌ NOT SAVING: Token {token.get('symbol', 'Unknown')} with score {score_norm} (risk: {risk})")
-                
-                report = format_report(token, summary, now_str, threshold)
-                print(report)
-                print("\n")
-            
-            time.sleep(interval)
-            
+        asyncio.run(start_monitoring())
     except KeyboardInterrupt:
-        print("\n🛑 Monitoring stopped.")
-        print("\n💝 If you loved this tool, feel free to donate to:")
-        print("   FnqoYxGvhzJdiKvw5e8MGT2sL5V69XCTSCqA7uU4WX7v")
-        input("Press Enter to continue...")
+        pass
+    print("\n🛑 Monitoring stopped.")
+    print("\n💝 If you loved this tool, feel free to donate to:")
+    print("   FnqoYxGvhzJdiKvw5e8MGT2sL5V69XCTSCqA7uU4WX7v")
+    input("Press Enter to continue...")
 
 def view_historical_data():
-    """View all stored tokens from safe_to_buy.json."""
-    tokens = load_json(SAFE_TO_BUY_FILE)
+    """View all stored tokens from the safe-token store."""
+    # Stream records straight from disk instead of materializing the whole history
+    tokens = iter_jsonl(SAFE_TO_BUY_FILE)
+    first = next(tokens, None)
     
-    if not tokens:
-        print("\n📭 No tokens found in safe_to_buy.json")
+    if first is None:
+        print(f"\n📭 No tokens found in {os.path.basename(SAFE_TO_BUY_FILE)}")
         input("Press Enter to continue...")
         return
     
-    print(f"\n📊 Historical Data - {len(tokens)} tokens found")
+    print("\n📊 Historical Data")
     print("=" * 80)
     
-    for i, token in enumerate(tokens, 1):
+    i = 0
+    for i, token in enumerate(itertools.chain([first], tokens), 1):
         print(f"\n{i}. Token: {token.get('symbol', 'Unknown')}")
         print(f"   Name: {token.get('name', 'Unknown')}")
         print(f"   Mint: {token.get('mint', 'Unknown')}")
@@ -270,7 +626,7 @@ def view_historical_data():
             for risk in risks:
                 print(f"     • {risk.get('name', 'Unknown')} ({risk.get('level', 'Unknown')})")
     
-    print(f"\n📈 Total tokens stored: {len(tokens)}")
+    print(f"\n📈 Total tokens stored: {i}")
     input("Press Enter to continue...")
 
 def show_configuration():
@@ -347,20 +703,31 @@ def edit_configuration():
         
         input("Press Enter to continue...")
 
+# Raw key codes mapped to menu actions
+WINDOWS_KEYS = {b'H': 'up', b'P': 'down', b'\r': 'enter', b'3': 'escape'}
+POSIX_KEYS = {b'\x1b[A': 'up', b'\x1b[B': 'down', b'\n': 'enter', b'\r': 'enter', b'\x1b': 'escape'}
+
+def read_key() -> bytes:
+    """Block until a key is pressed and return its raw bytes."""
+    if msvcrt is not None:
+        return msvcrt.getch()
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        # Arrow keys arrive as a three-byte escape sequence
+        return os.read(fd, 3)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
 def get_arrow_key_input():
     """Get arrow key input for menu navigation."""
+    keys = WINDOWS_KEYS if msvcrt is not None else POSIX_KEYS
     try:
         while True:
-            if msvcrt.kbhit():
-                key = msvcrt.getch()
-                if key == b'H':  # Up arrow
-                    return 'up'
-                elif key == b'P':  # Down arrow
-                    return 'down'
-                elif key == b'\r':  # Enter
-                    return 'enter'
-                elif key == b'3':  # Escape
-                    return 'escape'
+            action = keys.get(read_key())
+            if action:
+                return action
     except:
         return None
 
@@ -406,7 +773,7 @@ def main_menu():
         elif arrow_input == 'enter':
             # Process the selected option
             if selected == 0:
-                start_monitoring()
+                run_monitoring()
             elif selected == 1:
                 view_historical_data()
             elif selected == 2:
@@ -421,7 +788,7 @@ def main_menu():
         try:
             choice = input().strip()
             if choice == "1" or choice.lower() == "start":
-                start_monitoring()
+                run_monitoring()
             elif choice == "2" or choice.lower() == "historical":
                 view_historical_data()
             elif choice == "3" or choice.lower() == "config":
@@ -498,6 +865,8 @@ def config_menu():
             break
 
 if __name__ == "__main__":
+    for legacy_path in LEGACY_SAFE_TO_BUY_FILES:
+        migrate_legacy_store(legacy_path, SAFE_TO_BUY_FILE)
     try:
         main_menu()
     except KeyboardInterrupt:
@@ -0,0 +1,31 @@
+import pytest
+
+import solana_token_detector as detector
+
+
+def baseline_classify_risk(score_normalised, threshold):
+    """The branching classifier the lookup table replaced."""
+    if score_normalised is None:
+        return "UNKNOWN"
+    if score_normalised > threshold:
+        return "LOW"
+    if score_normalised >= 50:
+        return "MEDIUM"
+    return "HIGH"
+
+
+SCORES = [None, *range(101), -50, -1, 101, 150, 0.5, 49.9, 50.0, 50.5, 80.0, 80.5, 99.9]
+
+
+@pytest.mark.parametrize("threshold", [1, 49, 50, 51, 80, 81, 99, 100])
+def test_classify_risk_matches_baseline(threshold):
+    for score in SCORES:
+        assert detector.classify_risk(score, threshold) == baseline_classify_risk(score, threshold), score
+
+
+@pytest.mark.parametrize("threshold", [1, 50, 81, 100])
+def test_risk_table_covers_every_integer_score(threshold):
+    table = detector.build_risk_table(threshold)
+
+    assert len(table) == 101
+    assert list(table) == [baseline_classify_risk(score, threshold) for score in range(101)]
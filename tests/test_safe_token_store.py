@@ -0,0 +1,85 @@
+import os
+import shutil
+
+import orjson
+
+import solana_token_detector as detector
+
+BUNDLED_HISTORY = os.path.join(os.path.dirname(__file__), os.pardir, "safe_to_buy.json")
+
+
+def write_batch(path, entries):
+    detector._PENDING_ENTRIES.extend(entries)
+    with open(path, "ab") as store:
+        detector.flush_pending_entries(store)
+
+
+def write_partial_frame(path):
+    """Simulate a crash halfway through flushing a batch."""
+    frame = detector._compressor.compress(orjson.dumps({"mint": "lost"}) + b"\n")
+    with open(path, "ab") as f:
+        f.write(frame[: len(frame) // 2])
+
+
+def mints(path):
+    return [item["mint"] for item in detector.iter_jsonl(path)]
+
+
+def test_truncated_final_frame_keeps_earlier_batches(tmp_path):
+    path = str(tmp_path / "safe_to_buy.jsonl.zst")
+    write_batch(path, [{"mint": "a"}, {"mint": "b"}])
+    write_batch(path, [{"mint": "c"}])
+    write_partial_frame(path)
+
+    assert mints(path) == ["a", "b", "c"]
+
+
+def test_repair_then_append_keeps_every_complete_batch(tmp_path):
+    path = str(tmp_path / "safe_to_buy.jsonl.zst")
+    write_batch(path, [{"mint": "a"}, {"mint": "b"}])
+    write_batch(path, [{"mint": "c"}])
+    write_partial_frame(path)
+
+    detector.repair_store(path)
+    write_batch(path, [{"mint": "d"}])
+
+    assert mints(path) == ["a", "b", "c", "d"]
+
+
+def test_repair_leaves_intact_store_untouched(tmp_path):
+    path = str(tmp_path / "safe_to_buy.jsonl.zst")
+    write_batch(path, [{"mint": "a"}])
+    write_batch(path, [{"mint": "b"}])
+    size = os.path.getsize(path)
+
+    detector.repair_store(path)
+
+    assert os.path.getsize(path) == size
+    assert mints(path) == ["a", "b"]
+
+
+def test_bundled_history_survives_truncate_then_append(tmp_path):
+    legacy_path = str(tmp_path / "safe_to_buy.json")
+    path = str(tmp_path / "safe_to_buy.jsonl.zst")
+    shutil.copy(BUNDLED_HISTORY, legacy_path)
+    detector.migrate_legacy_store(legacy_path, path)
+    stored = mints(path)
+
+    write_partial_frame(path)
+    detector.repair_store(path)
+    write_batch(path, [{"mint": "new"}])
+
+    assert mints(path) == stored + ["new"]
+    assert len(stored) == len(detector.load_json(legacy_path))
+
+
+def test_corrupt_legacy_history_is_not_migrated(tmp_path):
+    legacy_path = str(tmp_path / "safe_to_buy.json")
+    path = str(tmp_path / "safe_to_buy.jsonl.zst")
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        f.write('[{"mint": "a"}, {"mint": ')
+
+    detector.migrate_legacy_store(legacy_path, path)
+
+    assert not os.path.exists(path)
+    assert os.path.exists(legacy_path)